@@ -1,6 +1,320 @@
 import tkinter as tk
 from tkinter import messagebox
+import bisect
 import math
+import time
+
+# Optional turbo: if numba is around, the collision loop below gets compiled
+# to machine code (~20-50x on the loop body). If it isn't, the decorator
+# becomes a no-op and the plain Python loop still works fine.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# numpy is only needed for the batched mass-sweep mode; the single-run
+# engines are plain Python on purpose.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_INF = float('inf')
+
+@njit(cache=True, fastmath=True)
+def _step_kernel(x1, x2, v1, v2, w2, dt, cos2t, sin2t, sqm1, sqm2):
+    # The hot loop from PhysicsEngine.step, pulled out to module level so
+    # numba can compile it: plain scalars in, plain scalars out, no Python
+    # object attribute access anywhere inside.
+    #
+    # Collisions are resolved in Galperin's phase-space coordinates
+    # (p1, p2) = (sqrt(m1)*v1, sqrt(m2)*v2), where a block collision is a
+    # pure reflection: it preserves p1^2 + p2^2 (the kinetic energy) exactly,
+    # with none of the cancellation the textbook velocity formulas suffer in
+    # the high-mass regime. That cancellation can leave v1 hovering just
+    # below v2 near the end of a 10^8 kg run, so the finish condition never
+    # fires and the loop spins forever. cos2t/sin2t are cos/sin of twice the
+    # Galperin angle, precomputed by the caller.
+    inv_sqm1 = 1.0 / sqm1
+    inv_sqm2 = 1.0 / sqm2
+    p1 = sqm1 * v1
+    p2 = sqm2 * v2
+
+    collisions = 0
+    time_remaining = dt
+
+    # Divisions are several times pricier than multiplies, so we cache the
+    # inverse velocities and only refresh them when a collision actually
+    # changes a velocity. Inside the loop it's multiplies all the way down.
+    neg_inv_v2 = -1.0 / v2 if v2 < 0 else 0.0
+    inv_closing = 1.0 / (v2 - v1) if v1 < v2 else 0.0
+
+    # Fast path: if the next collision (if any) is further away than this
+    # whole frame, it's one ballistic hop - no need to enter the loop at all.
+    # Between collisions (which is most frames on a big-mass run) this is the
+    # entire cost of a step. A "no collision ever" outcome falls out of the
+    # sentinel dt + 1, so there's no infinity to construct or min() against.
+    t_first = dt + 1.0
+    if v2 < 0:
+        t_first = x2 * neg_inv_v2
+    if v1 < v2:
+        t_block0 = (x1 - (x2 + w2)) * inv_closing
+        if t_block0 < t_first:
+            t_first = t_block0
+    if t_first > dt:
+        x1 += v1 * dt
+        x2 += v2 * dt
+        finished = v1 >= 0 and v2 >= 0 and v1 >= v2
+        return x1, x2, v1, v2, 0, finished
+
+    while time_remaining > 0:
+        # Decision tree over which events are even possible this iteration;
+        # the impossible arms never get a time computed, so no infinity
+        # sentinels are needed and min() disappears.
+        wall_possible = v2 < 0
+        block_possible = v1 < v2
+
+        if wall_possible and block_possible:
+            t_wall = x2 * neg_inv_v2
+            t_block = (x1 - (x2 + w2)) * inv_closing
+            is_wall = t_wall < t_block
+            t_next = t_wall if is_wall else t_block
+        elif wall_possible:
+            t_next = x2 * neg_inv_v2
+            is_wall = True
+        elif block_possible:
+            t_next = (x1 - (x2 + w2)) * inv_closing
+            is_wall = False
+        else:
+            # Nothing can ever collide again - coast out the frame and leave
+            x1 += v1 * time_remaining
+            x2 += v2 * time_remaining
+            break
+
+        if t_next <= time_remaining:
+            # A collision happens *during* this time step.
+            # Fast-forward exactly to the moment of impact.
+            x1 += v1 * t_next
+            x2 += v2 * t_next
+            time_remaining -= t_next
+
+            # Handle the bounce
+            if is_wall:
+                # Bouncing off the wall just flips the direction
+                v2 = -v2
+                p2 = -p2
+            else:
+                # Elastic block collision = reflection in (p1, p2) space
+                p1, p2 = cos2t * p1 + sin2t * p2, sin2t * p1 - cos2t * p2
+                v1 = p1 * inv_sqm1
+                v2 = p2 * inv_sqm2
+            collisions += 1
+
+            # Velocities changed, so the cached inverses need a refresh
+            neg_inv_v2 = -1.0 / v2 if v2 < 0 else 0.0
+            inv_closing = 1.0 / (v2 - v1) if v1 < v2 else 0.0
+        else:
+            # No collisions in this time step, just coast
+            x1 += v1 * time_remaining
+            x2 += v2 * time_remaining
+            time_remaining = 0.0
+
+    # Done when both blocks are headed away from the wall and the big one is
+    # outrunning the small one, so they'll never touch again.
+    finished = v1 >= 0 and v2 >= 0 and v1 >= v2
+    return x1, x2, v1, v2, collisions, finished
+
+# If the compiled Cython kernel has been built (python setup.py build_ext
+# --inplace), prefer it - it's the same loop in C, no interpreter and no
+# numba warm-up. Missing extension just means we keep the version above.
+try:
+    from physics_kernel import step_kernel as _step_kernel
+except ImportError:
+    pass
+
+# GPU sweep support: counting collisions for one mass is a couple of
+# transcendental ops, so a research-scale sweep over thousands of masses
+# maps to one CUDA thread per mass. Entirely optional - no numba, no GPU,
+# no problem.
+try:
+    from numba import cuda as _cuda
+    _HAS_CUDA = _cuda.is_available()
+except Exception:
+    _cuda = None
+    _HAS_CUDA = False
+
+if _HAS_CUDA:
+    @_cuda.jit
+    def _count_collisions_kernel(m1_arr, out):
+        i = _cuda.grid(1)
+        if i < m1_arr.size:
+            theta = math.atan(math.sqrt(1.0 / m1_arr[i]))
+            k = int(math.pi / theta)
+            # pi/theta landing exactly on an integer (equal masses) means
+            # the k-th "collision" only grazes - it doesn't happen
+            if k * theta >= math.pi - 1e-12:
+                k -= 1
+            out[i] = k
+
+def sweep_collision_counts(masses):
+    """Total collision count for each mass, straight from Galperin's formula.
+
+    One GPU thread per mass when numba's CUDA support and a device are
+    available; otherwise a plain Python loop, which is perfectly fine for
+    the handful of masses the sweep window uses.
+    """
+    if _HAS_CUDA and np is not None:
+        m1_arr = np.asarray(masses, dtype=np.float64)
+        out = np.zeros(m1_arr.size, dtype=np.int64)
+        threads = 128
+        blocks = (m1_arr.size + threads - 1) // threads
+        _count_collisions_kernel[blocks, threads](m1_arr, out)
+        return [int(n) for n in out]
+
+    counts = []
+    for m in masses:
+        theta = math.atan(math.sqrt(1.0 / m))
+        k = int(math.pi / theta)
+        # Same integer-boundary caveat as in the CUDA kernel: for equal
+        # masses pi/theta is exactly 4, but the 4th collision only grazes
+        if k * theta >= math.pi - 1e-12:
+            k -= 1
+        counts.append(k)
+    return counts
+
+class ClosedFormEngine:
+    """The "cheat mode" engine: instead of simulating every bounce, we use
+    Galperin's result directly.
+
+    The trick: in the coordinates (p1, p2) = (sqrt(m1)*v1, sqrt(m2)*v2) every
+    block collision is a reflection and every wall bounce flips p2, so the
+    whole collision sequence is just a ray bouncing between two mirrors with
+    angle theta = atan(sqrt(m2/m1)) between them. Unfold the mirrors and you
+    get the famous total of floor(pi / theta) collisions.
+
+    We build the full event table (time, positions, velocities at each
+    collision) once up front, and then step() is nothing but a clock advance
+    plus a binary search - O(log N) per frame no matter how huge the mass is.
+    The naive engine grinds through every collision inside the Tk mainloop,
+    which for m1 = 10^8 means hundreds of thousands of loop iterations in a
+    single frame. This one never breaks a sweat.
+    """
+
+    def __init__(self, mass_large, velocity_large):
+        # Same setup as PhysicsEngine so the App can use either one
+        self.m1 = mass_large
+        self.m2 = 1.0
+
+        self.x1 = 400.0
+        self.x2 = 200.0
+        self.w1 = 150.0
+        self.w2 = 50.0
+
+        self.v1 = velocity_large
+        self.v2 = 0.0
+
+        self.collisions = 0
+        self.finished = False
+
+        # The magic angle. Every collision advances the phase-space ray by
+        # theta, and it runs out of room after pi/theta reflections.
+        self.theta = math.atan(math.sqrt(self.m2 / self.m1))
+        self.N_total = int(math.pi / self.theta)
+
+        sqm1 = math.sqrt(self.m1)
+        sqm2 = math.sqrt(self.m2)
+        # Phase-space radius: p1^2 + p2^2 = R^2 at all times (energy)
+        R = sqm1 * abs(self.v1)
+
+        # --- Precompute the whole collision history, event by event ---
+        # Each entry: state *just after* collision k happened at _times[k].
+        #
+        # Two facts make this loop simple. First, collisions strictly
+        # alternate block, wall, block, wall, ... (after a block hit the
+        # pair always separates, so the only possible next event is the
+        # wall; after a wall bounce the only possible next event is the
+        # block). So the event type is just the parity of k - no time
+        # comparison needed. Second, the velocities after collision k come
+        # straight from the unfolded-mirror picture: after j block hits the
+        # phase-space ray sits at angle 2*j*theta, so
+        #     p1 = -R*cos(2*j*theta),  p2 = -/+ R*sin(2*j*theta)
+        # (sign of p2 by parity: toward the wall right after a block hit,
+        # away from it after the bounce). Evaluating cos/sin of k*theta
+        # directly means zero accumulated rounding no matter how many
+        # events there are - each entry is as accurate as the first.
+        self._times = []
+        self._states = []   # (x1, x2, v1, v2) right after each collision
+
+        t = 0.0
+        x1, x2 = self.x1, self.x2
+        v1, v2 = self.v1, self.v2
+        k = 0
+
+        # Velocities within a tiny sliver of zero are rounding artifacts of
+        # the cos/sin evaluation at the very end of the sequence (sin(pi)
+        # isn't exactly 0.0), not real motion - without the tolerance, equal
+        # masses pick up a phantom extra collision at t ~ 1e16.
+        eps = 1e-12 * abs(self.v1)
+
+        while v2 < -eps or v1 < v2 - eps:
+            if k % 2:
+                # Odd number of collisions so far -> small block is heading
+                # for the wall
+                t_next = x2 / -v2
+            else:
+                # Even -> the big block is bearing down on the small one
+                t_next = (x1 - (x2 + self.w2)) / (v2 - v1)
+
+            # Fast-forward to the moment of impact
+            t += t_next
+            x1 += v1 * t_next
+            x2 += v2 * t_next
+
+            k += 1
+            j = (k + 1) // 2          # block collisions seen so far
+            angle = 2.0 * j * self.theta
+            p1 = -R * math.cos(angle)
+            p2 = (-R if k % 2 else R) * math.sin(angle)
+            v1 = p1 / sqm1
+            v2 = p2 / sqm2
+
+            self._times.append(t)
+            self._states.append((x1, x2, v1, v2))
+
+        # Simulation-time cursor for step(), plus the pristine initial state
+        # so frame 0 interpolation has something to start from
+        self.t = 0.0
+        self._initial = (self.x1, self.x2, self.v1, self.v2)
+
+        if not self._times:
+            # Big block was never headed for the small one; nothing to do
+            self.finished = True
+
+    def step(self, dt):
+        # Advance the clock and look up where we are in the precomputed story
+        self.t += dt
+        k = bisect.bisect_right(self._times, self.t)
+
+        if k == 0:
+            # Still on the initial free flight before the first collision
+            t0 = 0.0
+            x1, x2, v1, v2 = self._initial
+        else:
+            t0 = self._times[k - 1]
+            x1, x2, v1, v2 = self._states[k - 1]
+
+        # Linear interpolation within the current free-flight segment
+        dt_seg = self.t - t0
+        self.x1 = x1 + v1 * dt_seg
+        self.x2 = x2 + v2 * dt_seg
+        self.v1 = v1
+        self.v2 = v2
+
+        self.collisions = k
+        self.finished = k >= len(self._times)
 
 class PhysicsEngine:
     def __init__(self, mass_large, velocity_large):
@@ -24,75 +338,130 @@ class PhysicsEngine:
         self.collisions = 0
         self.finished = False
 
-    def step(self, dt):     
-        # We track how much time we have left to simulate in this frame
-        time_remaining = dt
-        
-        while time_remaining > 0:
-            # 1. Check if the small block is about to smack into the wall (x=0)
-            if self.v2 < 0:
-                t_wall = self.x2 / abs(self.v2)
-            else:
-                # If it's moving away from the wall, it'll never hit it
-                t_wall = float('inf')
-
-            # 2. Check if the blocks are about to hit each other
-            # Collision happens when the big block touches the right side of the small block
-            if self.v1 < self.v2: 
-                # We only care if the big block is actually catching up to the small one
-                distance_between = self.x1 - (self.x2 + self.w2)
-                closing_speed = self.v2 - self.v1
-                t_block = distance_between / closing_speed
-            else:
-                t_block = float('inf')
-
-            # Which happens first? The wall hit or the block hit?
-            t_next = min(t_wall, t_block)
-
-            if t_next <= time_remaining:
-                # Okay, a collision happens *during* this time step.
-                # Fast-forward exactly to the moment of impact.
-                self.x1 += self.v1 * t_next
-                self.x2 += self.v2 * t_next
-                time_remaining -= t_next
-                
-                # Handle the bounce
-                if t_wall < t_block:
-                    self.resolve_wall_collision()
-                else:
-                    self.resolve_block_collision()
-            else:
-                # No collisions in this time step, just move everything forward normally
-                self.x1 += self.v1 * time_remaining
-                self.x2 += self.v2 * time_remaining
-                time_remaining = 0
-                
-        # Check if we're done. 
-        # This happens when both blocks are moving away from the wall (positive velocity)
-        # AND the big block is moving faster than the small one, so they'll never touch again.
-        if self.v1 >= 0 and self.v2 >= 0 and self.v1 >= self.v2:
+        # Collision constants for the Galperin rotation form: the reflection
+        # angle only depends on the masses, so precompute it here. (These
+        # play the role of the old explicit 2x2 collision matrix - same
+        # update, but energy-preserving by construction.)
+        self._sqm1 = math.sqrt(self.m1)
+        self._sqm2 = math.sqrt(self.m2)
+        # cos/sin of twice the Galperin angle atan(sqrt(m2/m1)). The
+        # algebraic forms below are exact where the trig round trip isn't -
+        # e.g. for equal masses cos(2*atan(1)) comes out as 6e-17 instead of
+        # 0, which leaves a phantom sliver of velocity after the last bounce.
+        self._cos = (self.m1 - self.m2) / (self.m1 + self.m2)
+        self._sin = 2 * self._sqm1 * self._sqm2 / (self.m1 + self.m2)
+
+        # Galperin's theorem tells us the total collision count in advance,
+        # so use it as a backstop termination signal: once we've seen that
+        # many bounces we're done, no matter what the velocity signs say.
+        # (+2 margin in case rounding squeezes in a stray extra bounce.)
+        self._max_collisions = int(math.pi * math.sqrt(self.m1 / self.m2)) + 2
+
+    def step(self, dt):
+        # All the real work happens in _step_kernel (which numba can compile).
+        # We just hand it plain numbers and unpack the results.
+        (self.x1, self.x2, self.v1, self.v2,
+         collisions_delta, finished) = _step_kernel(self.x1, self.x2, self.v1, self.v2,
+                                                    self.w2, dt,
+                                                    self._cos, self._sin,
+                                                    self._sqm1, self._sqm2)
+        self.collisions += collisions_delta
+        # Either signal will do: the velocity test from the kernel, or the
+        # a-priori count - the latter is immune to float sign subtleties.
+        if finished or self.collisions >= self._max_collisions:
             self.finished = True
 
-    def resolve_wall_collision(self):
-        # Bouncing off the wall just flips the direction
-        self.v2 *= -1
-        self.collisions += 1
-
-    def resolve_block_collision(self):
-        # Good old high school physics: 1D perfectly elastic collision formulas.
-        # Conservation of momentum and kinetic energy.
-        u1 = self.v1
-        u2 = self.v2
-        m1 = self.m1
-        m2 = self.m2
-        
-        # The math gets messy, but this calculates the new velocities
-        v1 = ((m1 - m2) * u1 + 2 * m2 * u2) / (m1 + m2)
-        v2 = ((m2 - m1) * u2 + 2 * m1 * u1) / (m1 + m2)
-        
-        self.v1 = v1
-        self.v2 = v2
-        self.collisions += 1
+class BatchedPhysicsEngine:
+    """Runs a whole family of simulations at once - one per mass value.
+
+    Handy for the classic exploration: sweep m1 over powers of 100 and watch
+    the collision counts spell out the digits of pi. State lives in
+    struct-of-arrays numpy vectors (x1[i], v1[i], ... for simulation i), so
+    one vectorized step() advances every simulation together instead of
+    paying Python interpreter overhead N times over.
+    """
+
+    def __init__(self, masses, velocity_large):
+        if np is None:
+            raise RuntimeError("BatchedPhysicsEngine needs numpy")
+
+        masses = np.asarray(masses, dtype=np.float64)
+        n = len(masses)
+
+        # float32 halves the memory traffic and doubles the SIMD lane count,
+        # and the numbers here (positions of a few hundred units, velocities
+        # around 1e2) fit it comfortably. Very large masses are the
+        # exception - their collision coefficients sit too close to 1 for
+        # single precision - so any lane beyond 1e6 kg bumps the whole batch
+        # to float64.
+        dtype = np.float32 if masses.max() <= 1e6 else np.float64
+        self.dtype = dtype
+
+        self.m1 = masses.astype(dtype)
+        self.m2 = 1.0
+
+        # Same starting layout as the single-run engines, just N copies
+        self.x1 = np.full(n, 400.0, dtype=dtype)
+        self.x2 = np.full(n, 200.0, dtype=dtype)
+        self.w2 = 50.0
+
+        self.v1 = np.full(n, float(velocity_large), dtype=dtype)
+        self.v2 = np.zeros(n, dtype=dtype)
+
+        self.collisions = np.zeros(n, dtype=np.int64)
+        self.finished = np.zeros(n, dtype=bool)
+
+        # Per-simulation elastic-collision matrix (masses differ per lane)
+        s = 1.0 / (self.m1 + self.m2)
+        self._a = (self.m1 - self.m2) * s
+        self._b = 2.0 * self.m2 * s
+        self._c = 2.0 * self.m1 * s
+        self._d = (self.m2 - self.m1) * s
+
+    def step(self, dt):
+        # Every lane gets the same time budget; lanes burn through it at
+        # their own pace (one collision per pass through the while loop).
+        time_remaining = np.where(self.finished, 0.0, dt)
+
+        while True:
+            active = time_remaining > 0.0
+            if not active.any():
+                break
+
+            # Next event per lane. The masked-off branches of the where()s
+            # can divide by zero, hence the errstate - those lanes pick the
+            # inf arm anyway.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_wall = np.where(self.v2 < 0, self.x2 / np.abs(self.v2), np.inf)
+                t_block = np.where(self.v1 < self.v2,
+                                   (self.x1 - self.x2 - self.w2) / (self.v2 - self.v1),
+                                   np.inf)
+            t_next = np.minimum(t_wall, t_block)
+
+            # Lanes whose next collision is beyond their budget just coast
+            # to the end of the frame; the rest fast-forward to the impact.
+            coast = active & (t_next > time_remaining)
+            hit = active & ~coast
+            advance = np.where(coast, time_remaining, np.where(hit, t_next, 0.0))
+
+            self.x1 += self.v1 * advance
+            self.x2 += self.v2 * advance
+            time_remaining = np.where(coast, 0.0, time_remaining - advance)
+
+            # Resolve the collisions: wall bounce flips v2, block collision
+            # applies the per-lane elastic matrix. The two masks are disjoint.
+            wall = hit & (t_wall <= t_block)
+            block = hit & ~wall
+
+            self.v2 = np.where(wall, -self.v2, self.v2)
+            u1, u2 = self.v1, self.v2
+            self.v1 = np.where(block, self._a * u1 + self._b * u2, u1)
+            self.v2 = np.where(block, self._c * u1 + self._d * u2, u2)
+
+            self.collisions += hit
+
+        # Same settling test as the scalar engine, vectorized
+        self.finished |= (self.v1 >= 0) & (self.v2 >= 0) & (self.v1 >= self.v2)
 
 class App:
     def __init__(self, root):
@@ -115,6 +484,22 @@ class App:
         self.canvas = tk.Canvas(self.canvas_frame, bg="#1e1e1e", width=self.width, height=self.height)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        self.ground_y = 400
+
+        # Create every canvas item exactly once, up front. draw() only moves
+        # and re-texts them - deleting and recreating items at 60 Hz churns
+        # Tk's item table, and that (not the physics) is what the UI spends
+        # its time on.
+        self.wall_id = self.canvas.create_line(20, 50, 20, self.ground_y, fill="gray", width=5)
+        self.floor_id = self.canvas.create_line(20, self.ground_y, self.width, self.ground_y, fill="gray", width=2)
+        self.small_id = self.canvas.create_rectangle(0, 0, 0, 0, fill="#3498db", outline="white", width=2)
+        self.small_text_id = self.canvas.create_text(0, 0, text="1kg", fill="white")
+        self.large_id = self.canvas.create_rectangle(0, 0, 0, 0, fill="#e74c3c", outline="white", width=2)
+        self.large_text_id = self.canvas.create_text(0, 0, text="", fill="white", font=("Arial", 12, "bold"))
+        self.counter_text_id = self.canvas.create_text(self.width / 2, 80, text="0", fill="white", font=("Arial", 60, "bold"))
+        self.finished_text_id = self.canvas.create_text(self.width / 2, 160, text="FINISHED", fill="#2ecc71",
+                                                        font=("Arial", 20), state="hidden")
+
         # --- Controls Section ---
         
         # Input for the Big Mass
@@ -130,17 +515,38 @@ class App:
         self.vel_entry.pack(side=tk.LEFT)
 
         # The "Go" Button
-        self.reset_btn = tk.Button(self.control_frame, text="RESET / APPLY", command=self.reset_simulation, 
+        self.reset_btn = tk.Button(self.control_frame, text="RESET / APPLY", command=self.reset_simulation,
                                    bg="#3498db", fg="white", font=("Arial", 12, "bold"), padx=20)
         self.reset_btn.pack(side=tk.LEFT, padx=30)
+
+        # Closed-form mode is the default: it never hangs the UI, even for
+        # absurd masses. Untick it to watch the engine sweat through every
+        # collision the old-fashioned way.
+        self.exact_var = tk.BooleanVar(value=True)
+        self.exact_check = tk.Checkbutton(self.control_frame, text="Exact (closed-form)", variable=self.exact_var,
+                                          bg="#f0f0f0", font=("Arial", 11), command=self.reset_simulation)
+        self.exact_check.pack(side=tk.LEFT)
+
+        # Mass sweep: run a batch of simulations side by side and watch pi
+        # show up digit by digit (needs numpy)
+        self.sweep_btn = tk.Button(self.control_frame, text="MASS SWEEP", command=self.open_sweep,
+                                   bg="#9b59b6", fg="white", font=("Arial", 12, "bold"), padx=10)
+        self.sweep_btn.pack(side=tk.LEFT, padx=10)
         
         # Display the math prediction so we know if the code is working
         self.info_label = tk.Label(self.control_frame, text="Theoretical: 31", bg="#f0f0f0", fg="#555", font=("Arial", 12))
         self.info_label.pack(side=tk.RIGHT, padx=20)
 
         # Game State
-        self.ground_y = 400
         self.engine = None
+        self._last_frame = None   # (x1, x2, collisions, finished) of last draw
+
+        # Per-item dirty tracking for draw(): what each canvas item was last
+        # told, so unchanged items cost zero Tk calls
+        self._drawn_x1 = None
+        self._drawn_x2 = None
+        self._drawn_count = None
+        self._drawn_finished = None
         
         # Kick things off
         self.reset_simulation()
@@ -156,7 +562,25 @@ class App:
                 raise ValueError("Mass must be positive")
             
             # Spin up a fresh physics engine
-            self.engine = PhysicsEngine(m1, v1)
+            engine_cls = ClosedFormEngine if self.exact_var.get() else PhysicsEngine
+            self.engine = engine_cls(m1, v1)
+
+            # Visual trickery:
+            # If the mass is 1,000,000kg, we can't draw it to scale or it covers
+            # the whole screen. So we cheat and use a log scale to make it look
+            # "heavy" without breaking the UI. The mass never changes mid-run,
+            # so size and label are computed once here, not every frame.
+            size_scale = math.log10(m1) * 20 if m1 > 1 else 20
+            self._size1 = max(80, min(250, 50 + size_scale))
+            self._mass_txt = f"{m1:.0f} kg"
+            self.canvas.itemconfig(self.large_text_id, text=self._mass_txt)
+
+            # Force a redraw even if the new run starts where the old one sat
+            self._last_frame = None
+            self._drawn_x1 = None
+            self._drawn_x2 = None
+            self._drawn_count = None
+            self._drawn_finished = None
             
             # Fun Fact: The number of collisions relates to Pi based on powers of 100 for the mass.
             # e.g., mass=100 -> 31 collisions (3.14...)
@@ -166,52 +590,119 @@ class App:
         except ValueError:
             messagebox.showerror("Input Error", "Please enter valid numeric values.")
 
+    def open_sweep(self):
+        if np is None:
+            messagebox.showerror("Missing Dependency", "The mass sweep needs numpy installed (pip install numpy).")
+            return
+
+        try:
+            v1 = float(self.vel_entry.get())
+        except ValueError:
+            v1 = -100.0
+
+        # Powers of 100: each row should contribute one more digit of pi
+        masses = [100.0 ** k for k in range(5)]
+        batch = BatchedPhysicsEngine(masses, v1)
+
+        win = tk.Toplevel(self.root)
+        win.title("Mass Sweep - Collisions vs Mass")
+
+        tk.Label(win, text="Mass (kg)", font=("Arial", 12, "bold"), padx=15).grid(row=0, column=0)
+        tk.Label(win, text="Collisions", font=("Arial", 12, "bold"), padx=15).grid(row=0, column=1)
+        tk.Label(win, text="Total (closed form)", font=("Arial", 12, "bold"), padx=15).grid(row=0, column=2)
+
+        # The endgame for every row, computed up front (on the GPU when one
+        # is around) so you can watch the live counts converge to it
+        totals = sweep_collision_counts(masses)
+
+        count_labels = []
+        for i, m in enumerate(masses):
+            tk.Label(win, text=f"{m:.0f}", font=("Arial", 12), padx=15).grid(row=i + 1, column=0, sticky="e")
+            lbl = tk.Label(win, text="0", font=("Arial", 12), padx=15)
+            lbl.grid(row=i + 1, column=1, sticky="e")
+            count_labels.append(lbl)
+            tk.Label(win, text=str(totals[i]), font=("Arial", 12), fg="#555", padx=15).grid(row=i + 1, column=2, sticky="e")
+
+        def tick():
+            if not win.winfo_exists():
+                return
+            if not batch.finished.all():
+                batch.step(1 / 60.0)
+                for lbl, count in zip(count_labels, batch.collisions):
+                    lbl.config(text=str(int(count)))
+                win.after(16, tick)
+
+        tick()
+
     def draw(self):
-        self.canvas.delete("all")
-        
         if not self.engine: return
 
-        # Draw the environment
-        self.canvas.create_line(20, 50, 20, self.ground_y, fill="gray", width=5) # The Wall
-        self.canvas.create_line(20, self.ground_y, self.width, self.ground_y, fill="gray", width=2) # The Floor
-        
-        # Draw Small Block (1kg)
-        x2_draw = 20 + self.engine.x2
-        y2_draw = self.ground_y - self.engine.w2
-        self.canvas.create_rectangle(x2_draw, y2_draw, x2_draw + self.engine.w2, self.ground_y, 
-                                     fill="#3498db", outline="white", width=2)
-        self.canvas.create_text(x2_draw + self.engine.w2/2, y2_draw + self.engine.w2/2, text="1kg", fill="white")
-
-        # Draw Large Block
-        x1_draw = 20 + self.engine.x1
-        
-        # Visual trickery:
-        # If the mass is 1,000,000kg, we can't draw it to scale or it covers the whole screen.
-        # So we cheat and use a log scale to make it look "heavy" without breaking the UI.
-        size_scale = math.log10(self.engine.m1) * 20 if self.engine.m1 > 1 else 20
-        size1 = max(80, min(250, 50 + size_scale)) 
-        
-        y1_draw = self.ground_y - size1
-        
-        self.canvas.create_rectangle(x1_draw, y1_draw, x1_draw + size1, self.ground_y, fill="#e74c3c", outline="white", width=2)
+        # Per-item dirty tracking: draw_if_changed() already skips identical
+        # frames, but within a changed frame usually only a subset of items
+        # moved - between collisions only the blocks slide, and the counter
+        # text is identical frame after frame. Only talk to Tk about the
+        # items that actually changed.
+
+        # Move the Small Block (1kg)
+        x2 = self.engine.x2
+        if x2 != self._drawn_x2:
+            self._drawn_x2 = x2
+            x2_draw = 20 + x2
+            y2_draw = self.ground_y - self.engine.w2
+            self.canvas.coords(self.small_id, x2_draw, y2_draw, x2_draw + self.engine.w2, self.ground_y)
+            self.canvas.coords(self.small_text_id, x2_draw + self.engine.w2/2, y2_draw + self.engine.w2/2)
 
-        # Label the big mass
-        mass_txt = f"{self.engine.m1:.0f} kg"
-        self.canvas.create_text(x1_draw + size1/2, y1_draw + size1/2, text=mass_txt, fill="white", font=("Arial", 12, "bold"))
+        # Move the Large Block (size and label were fixed at reset time)
+        x1 = self.engine.x1
+        if x1 != self._drawn_x1:
+            self._drawn_x1 = x1
+            x1_draw = 20 + x1
+            size1 = self._size1
+            y1_draw = self.ground_y - size1
+            self.canvas.coords(self.large_id, x1_draw, y1_draw, x1_draw + size1, self.ground_y)
+            self.canvas.coords(self.large_text_id, x1_draw + size1/2, y1_draw + size1/2)
 
         # The big collision counter in the background
-        self.canvas.create_text(self.width/2, 80, text=f"{self.engine.collisions}", fill="white", font=("Arial", 60, "bold"))
-        
-        if self.engine.finished:
-             self.canvas.create_text(self.width/2, 160, text="FINISHED", fill="#2ecc71", font=("Arial", 20))
+        if self.engine.collisions != self._drawn_count:
+            self._drawn_count = self.engine.collisions
+            self.canvas.itemconfig(self.counter_text_id, text=f"{self._drawn_count}")
+
+        # FINISHED banner: always exists, just hidden until it's true
+        if self.engine.finished != self._drawn_finished:
+            self._drawn_finished = self.engine.finished
+            self.canvas.itemconfig(self.finished_text_id, state="normal" if self._drawn_finished else "hidden")
 
     def animate(self):
-        if self.engine:
-            dt = (1/60.0) 
-            self.engine.step(dt)
+        if self.engine and not self.engine.finished:
+            # Advance this frame's 1/60 s of simulation in small substeps,
+            # but never spend more than ~10 ms of real time doing it. On a
+            # huge-mass run the substeps near the wall are expensive; the
+            # deadline means the animation dilates gracefully instead of
+            # freezing the mainloop for seconds, and the collision counter
+            # keeps ticking visibly the whole time.
+            deadline = time.perf_counter() + 0.010
+            budget = 1 / 60.0
+            substep = 1 / 600.0
+            while budget > 0 and not self.engine.finished and time.perf_counter() < deadline:
+                self.engine.step(substep)
+                budget -= substep
+            self.draw_if_changed()
+            self.root.after(16, self.animate)
+        else:
+            # Simulation settled (or hasn't started): no physics to run, so
+            # drop to a lazy refresh instead of burning CPU at 60 Hz forever.
+            self.draw_if_changed()
+            self.root.after(200, self.animate)
 
-        self.draw()
-        self.root.after(16, self.animate)
+    def draw_if_changed(self):
+        # On a big-mass run the blocks barely move between collisions, and
+        # once finished nothing moves at all - don't bother Tk if the frame
+        # would be identical to the last one.
+        if not self.engine: return
+        frame = (self.engine.x1, self.engine.x2, self.engine.collisions, self.engine.finished)
+        if frame != self._last_frame:
+            self._last_frame = frame
+            self.draw()
 
 if __name__ == "__main__":
     root = tk.Tk()
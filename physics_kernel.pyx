@@ -0,0 +1,91 @@
+# cython: language_level=3
+# cython: cdivision=True
+"""Compiled version of the collision step kernel from main.py.
+
+Build it in place with:
+
+    python setup.py build_ext --inplace
+
+main.py picks this up automatically when the compiled module is importable
+and silently falls back to the pure-Python/numba kernel otherwise, so
+building it is strictly optional. The body mirrors _step_kernel in main.py
+exactly - if you touch one, touch both.
+"""
+
+
+cpdef step_kernel(double x1, double x2, double v1, double v2, double w2,
+                  double dt, double cos2t, double sin2t,
+                  double sqm1, double sqm2):
+    cdef double inv_sqm1 = 1.0 / sqm1
+    cdef double inv_sqm2 = 1.0 / sqm2
+    cdef double p1 = sqm1 * v1
+    cdef double p2 = sqm2 * v2
+
+    cdef long collisions = 0
+    cdef double time_remaining = dt
+
+    cdef double neg_inv_v2 = -1.0 / v2 if v2 < 0 else 0.0
+    cdef double inv_closing = 1.0 / (v2 - v1) if v1 < v2 else 0.0
+
+    cdef double t_first, t_block0, t_wall, t_block, t_next, tmp
+    cdef bint wall_possible, block_possible, is_wall, finished
+
+    # Fast path: nothing collides within this frame -> one ballistic hop
+    t_first = dt + 1.0
+    if v2 < 0:
+        t_first = x2 * neg_inv_v2
+    if v1 < v2:
+        t_block0 = (x1 - (x2 + w2)) * inv_closing
+        if t_block0 < t_first:
+            t_first = t_block0
+    if t_first > dt:
+        x1 += v1 * dt
+        x2 += v2 * dt
+        finished = v1 >= 0 and v2 >= 0 and v1 >= v2
+        return x1, x2, v1, v2, 0, finished
+
+    while time_remaining > 0:
+        wall_possible = v2 < 0
+        block_possible = v1 < v2
+
+        if wall_possible and block_possible:
+            t_wall = x2 * neg_inv_v2
+            t_block = (x1 - (x2 + w2)) * inv_closing
+            is_wall = t_wall < t_block
+            t_next = t_wall if is_wall else t_block
+        elif wall_possible:
+            t_next = x2 * neg_inv_v2
+            is_wall = True
+        elif block_possible:
+            t_next = (x1 - (x2 + w2)) * inv_closing
+            is_wall = False
+        else:
+            x1 += v1 * time_remaining
+            x2 += v2 * time_remaining
+            break
+
+        if t_next <= time_remaining:
+            x1 += v1 * t_next
+            x2 += v2 * t_next
+            time_remaining -= t_next
+
+            if is_wall:
+                v2 = -v2
+                p2 = -p2
+            else:
+                tmp = cos2t * p1 + sin2t * p2
+                p2 = sin2t * p1 - cos2t * p2
+                p1 = tmp
+                v1 = p1 * inv_sqm1
+                v2 = p2 * inv_sqm2
+            collisions += 1
+
+            neg_inv_v2 = -1.0 / v2 if v2 < 0 else 0.0
+            inv_closing = 1.0 / (v2 - v1) if v1 < v2 else 0.0
+        else:
+            x1 += v1 * time_remaining
+            x2 += v2 * time_remaining
+            time_remaining = 0.0
+
+    finished = v1 >= 0 and v2 >= 0 and v1 >= v2
+    return x1, x2, v1, v2, collisions, finished
@@ -0,0 +1,104 @@
+"""Double-buffered pygame front end for the colliding-blocks simulation.
+
+The Tk canvas in main.py talks to the display server item by item; SDL2
+draws the whole frame into a back buffer and flips it to the screen in one
+go, which starts to matter once the physics is no longer the bottleneck.
+
+    python pygame_view.py [mass_large] [initial_velocity]
+
+Press R to restart the run. This file is drawing only - it reuses the
+engines from main.py unchanged. Needs pygame (pip install pygame); the Tk
+app keeps working without it.
+"""
+import math
+import sys
+
+import pygame
+
+from main import ClosedFormEngine
+
+WIDTH, HEIGHT = 1000, 600
+GROUND_Y = 400
+
+BG = (30, 30, 30)          # same palette as the Tk canvas
+GRAY = (128, 128, 128)
+WHITE = (255, 255, 255)
+BLUE = (52, 152, 219)      # #3498db
+RED = (231, 76, 60)        # #e74c3c
+GREEN = (46, 204, 113)     # #2ecc71
+
+
+def run(mass_large=100.0, velocity_large=-100.0):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Colliding Blocks - Computing Pi")
+    clock = pygame.time.Clock()
+
+    font_label = pygame.font.SysFont("Arial", 14, bold=True)
+    font_counter = pygame.font.SysFont("Arial", 60, bold=True)
+    font_done = pygame.font.SysFont("Arial", 20)
+
+    engine = ClosedFormEngine(mass_large, velocity_large)
+
+    # Same log-scale visual trick as the Tk app, computed once
+    size_scale = math.log10(mass_large) * 20 if mass_large > 1 else 20
+    size1 = max(80, min(250, 50 + size_scale))
+
+    # Static text surfaces are rendered once; the counter is re-rendered
+    # only when the count actually changes
+    small_label = font_label.render("1kg", True, WHITE)
+    mass_label = font_label.render(f"{mass_large:.0f} kg", True, WHITE)
+    done_label = font_done.render("FINISHED", True, GREEN)
+    counter_surf = font_counter.render("0", True, WHITE)
+    last_count = 0
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                engine = ClosedFormEngine(mass_large, velocity_large)
+
+        if not engine.finished:
+            engine.step(1 / 60.0)
+
+        screen.fill(BG)
+
+        # The wall and the floor
+        pygame.draw.line(screen, GRAY, (20, 50), (20, GROUND_Y), 5)
+        pygame.draw.line(screen, GRAY, (20, GROUND_Y), (WIDTH, GROUND_Y), 2)
+
+        # Small block (1kg)
+        x2 = 20 + engine.x2
+        small_rect = pygame.Rect(x2, GROUND_Y - engine.w2, engine.w2, engine.w2)
+        pygame.draw.rect(screen, BLUE, small_rect)
+        pygame.draw.rect(screen, WHITE, small_rect, 2)
+        screen.blit(small_label, small_label.get_rect(center=small_rect.center))
+
+        # Large block
+        x1 = 20 + engine.x1
+        large_rect = pygame.Rect(x1, GROUND_Y - size1, size1, size1)
+        pygame.draw.rect(screen, RED, large_rect)
+        pygame.draw.rect(screen, WHITE, large_rect, 2)
+        screen.blit(mass_label, mass_label.get_rect(center=large_rect.center))
+
+        # The big collision counter
+        if engine.collisions != last_count:
+            last_count = engine.collisions
+            counter_surf = font_counter.render(str(last_count), True, WHITE)
+        screen.blit(counter_surf, counter_surf.get_rect(center=(WIDTH // 2, 80)))
+
+        if engine.finished:
+            screen.blit(done_label, done_label.get_rect(center=(WIDTH // 2, 160)))
+
+        pygame.display.flip()
+        clock.tick(60)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    mass = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    vel = float(sys.argv[2]) if len(sys.argv) > 2 else -100.0
+    run(mass, vel)
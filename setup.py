@@ -0,0 +1,26 @@
+"""Build script for the optional compiled collision kernel.
+
+    python setup.py build_ext --inplace
+
+This is not needed to run the simulation - main.py falls back to its
+pure-Python (or numba-jitted) kernel when the extension isn't built.
+"""
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Building the compiled kernel needs Cython (pip install cython).")
+
+setup(
+    name="colliding-blocks-kernel",
+    ext_modules=cythonize(
+        [
+            Extension(
+                "physics_kernel",
+                ["physics_kernel.pyx"],
+                extra_compile_args=["-O3", "-ffast-math", "-march=native"],
+            )
+        ]
+    ),
+)